@@ -1,26 +1,47 @@
 import sys
 import os
+import io
 import re
+import logging
+import queue
 import threading
+import multiprocessing
 import speech_recognition as sr
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from PIL import Image
+# Pillow-SIMD installs as the same package; resize gets SSE4/AVX2 kernels:
+#   pip uninstall -y pillow && CC="cc -mavx2" pip install -U --force-reinstall pillow-simd
+from PIL import Image, __version__ as PIL_VERSION
 from datetime import datetime
+from dataclasses import dataclass
+
+try:
+    import pyvips  # optional: SIMD resize with shrink-on-load
+    # Each file is read once, so libvips' operation cache would only pin
+    # decoded images in memory across the batch
+    pyvips.cache_set_max(0)
+except ImportError:
+    pyvips = None
 
 from PyQt6.QtCore import (
-    Qt, QPropertyAnimation, pyqtProperty, QTimer, 
-    QEasingCurve, QSequentialAnimationGroup, QSize, pyqtSignal, QObject
+    Qt, QPropertyAnimation, QAbstractAnimation, QEasingCurve, QEvent, pyqtProperty, QTimer,
+    QSize, QRectF, pyqtSignal, QObject, QMetaObject, QThreadPool, QRunnable
 )
 from PyQt6.QtGui import (
-    QPixmap, QPainter, QPen, QColor, QLinearGradient, QBrush, QDoubleValidator
+    QPixmap, QPainter, QPen, QColor, QLinearGradient, QBrush, QDoubleValidator,
+    QPixmapCache, QImage, QImageReader, QTransform
 )
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
     QFileDialog, QMessageBox, QFrame, QGraphicsDropShadowEffect,
-    QLineEdit, QCheckBox, QProgressBar, QListWidget, QListWidgetItem, QGridLayout
+    QLineEdit, QCheckBox, QProgressBar, QListWidget, QGridLayout,
+    QStyledItemDelegate
 )
 from fpdf import FPDF
 
+logger = logging.getLogger(__name__)
+
 NUMBER_WORDS = {
     "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4,
     "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9,
@@ -30,6 +51,9 @@ NUMBER_WORDS = {
     "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50
 }
 
+IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".webp"})
+IMAGE_FILTER = "Images (*.png *.jpg *.jpeg *.webp)"
+
 # ---------- VOICE COMMAND KEYWORDS ----------
 width_keywords = ("width", "wide", "with", "breadth", "horizontal", "w")
 height_keywords = ("height", "high", "tall", "vertical", "h")
@@ -43,12 +67,377 @@ add_folder_keywords = ("folder", "add folder", "load folder")
 select_img_keywords = ("img", "image", "photo", "pic", "picture")
 end_keywords = ("stop listening", "exit")
 
+# In priority order: when an utterance names several, the first one wins
+VOICE_KEYWORDS = {
+    "width": width_keywords,
+    "height": height_keywords,
+    "start": start_keywords,
+    "apply_all": apply_all_keywords,
+    "ratio": ratio_keywords,
+    "pdf": pdf_keywords,
+    "remove": remove_keywords,
+    "add_folder": add_folder_keywords,
+    "add_image": add_image_keywords,
+    "end": end_keywords,
+}
+
+# Whole words only, so "w" or "go" no longer fire inside "window" or "good"
+_CATEGORY_RE = {
+    tag: re.compile(r"\b(?:" + "|".join(map(re.escape, kws)) + r")\b")
+    for tag, kws in VOICE_KEYWORDS.items()
+}
+_NUM_RE = re.compile(r"\d+\.?\d*")
+# Image keyword, optional dot, space(s), then digits: "image 3", "pic. 12"
+_SELECT_IMG_RE = re.compile(
+    "(?:" + "|".join(map(re.escape, select_img_keywords)) + r")\.?\s+(\d+)"
+)
+
+# ---------- STYLESHEETS ----------
+# Shared strings: Qt parses each distinct stylesheet once and reuses it
+PREVIEW_IDLE_STYLE = """
+    QLabel {
+        color: white; 
+        font-size: 16px; 
+        background: rgba(10, 25, 41, 0.7); 
+        border-radius: 20px;
+        border: 2px solid #1e3a5f;
+    }
+"""
+PREVIEW_DRAG_STYLE = PREVIEW_IDLE_STYLE.replace("#1e3a5f", "#00eaff")
+PREVIEW_LOADED_STYLE = "QLabel { background: #050a10; border-radius: 20px; border: 2px solid #00eaff; }"
+INPUT_STYLE = """
+    background: #1e293b;
+    color: white;
+    border: 1px solid #334155;
+    padding: 8px;
+    border-radius: 6px;
+"""
+CHECKBOX_STYLE = """
+    QCheckBox {
+        background: transparent;
+    }
+
+    /* checkbox square */
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border-radius: 4px;
+        border: 2px solid #00eaff;
+        background-color: transparent;
+    }
+
+    /* hover state */
+    QCheckBox::indicator:hover {
+        background-color: rgba(0, 234, 255, 40);
+        border: 1px solid #00ffff;
+    }
+
+    /* checked state */
+    QCheckBox::indicator:checked {
+        background-color: #00eaff;
+        border: 1px solid #00ffff;
+    }
+
+    /* pressed state */
+    QCheckBox::indicator:pressed {
+        background-color: rgba(0, 255, 255, 120);
+    }
+"""
+OPTION_CHECKBOX_STYLE = """
+    QCheckBox {
+        background: transparent;
+    }
+
+    /* checkbox square */
+    QCheckBox::indicator {
+        width: 14px;
+        height: 14px;
+        border-radius: 4px;
+        border: 1px solid #00eaff;
+        background-color: transparent;
+    }
+
+    /* hover state */
+    QCheckBox::indicator:hover {
+        background-color: rgba(0, 234, 255, 40);
+        border: 1px solid #00ffff;
+    }
+
+    /* checked state */
+    QCheckBox::indicator:checked {
+        background-color: #00eaff;
+        border: 1px solid #00ffff;
+    }
+
+    /* pressed state */
+    QCheckBox::indicator:pressed {
+        background-color: rgba(0, 255, 255, 120);
+    }
+"""
+OPTION_LABEL_STYLE = "color: #cfefff; font-size: 14px; background: transparent;"
+
+PX_PER_CM = 300 / 2.54   # output is rendered at 300 DPI
+format_cm = "{:.1f}".format  # bound once, used on every synced keystroke
+
 def words_to_number(text):
-        total = 0
-        for word in text.split():
-            if word in NUMBER_WORDS:
-                total += NUMBER_WORDS[word]
-        return total if total > 0 else None
+    total = sum(NUMBER_WORDS.get(word, 0) for word in text.split())
+    return total if total > 0 else None
+
+def match_command(text):
+    """First VOICE_KEYWORDS category spoken in text, or None"""
+    for tag, pattern in _CATEGORY_RE.items():
+        if pattern.search(text):
+            return tag
+    return None
+
+# ----------------------------------------------------------------------
+# BATCH PROCESSING (runs off the UI thread)
+# ----------------------------------------------------------------------
+
+def _flatten_to_rgb(img):
+    """RGB for JPEG output; transparent areas become white, as on paper"""
+    if img.mode in ("RGB", "L"):
+        return img
+    if img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info):
+        rgba = img.convert("RGBA")
+        flat = Image.new("RGB", img.size, (255, 255, 255))
+        flat.paste(rgba, mask=rgba.getchannel("A"))
+        return flat
+    return img.convert("RGB")
+
+def _resize_one(args):
+    """Resize a single image (runs in a worker process or thread).
+
+    Saves to save_path, or returns the resized image as in-memory JPEG
+    bytes when save_path is None (PDF mode)."""
+    path, w_cm, h_cm, save_path = args
+    target_w = int(w_cm * PX_PER_CM)
+    target_h = int(h_cm * PX_PER_CM)
+    # JPEG: q90 with 4:2:0 chroma for saved files, q85 for the PDF's copies;
+    # plain baseline Huffman coding, no extra optimize/progressive passes
+    ext = os.path.splitext(save_path)[1].lower() if save_path else ".jpg"
+    is_jpeg = ext in (".jpg", ".jpeg")
+
+    if pyvips is not None:
+        # Decode + resize in one streaming pass, never materializing full-res pixels
+        vim = pyvips.Image.thumbnail(path, target_w, height=target_h, size="force", no_rotate=True)
+        if save_path is None:
+            if vim.hasalpha():
+                vim = vim.flatten(background=255)
+            return (vim.write_to_buffer(".jpg", Q=85, subsample_mode="on"), w_cm, h_cm)
+        if is_jpeg:
+            vim.write_to_file(save_path, Q=90, subsample_mode="on")
+        else:
+            vim.write_to_file(save_path + ("[Q=95]" if ext == ".webp" else ""))
+    else:
+        with Image.open(path) as img:
+            if img.format == "JPEG":
+                # Let libjpeg decode at 1/2, 1/4 or 1/8 scale; LANCZOS does the rest
+                img.draft("RGB", (target_w * 2, target_h * 2))
+            if save_path is None:
+                # Flatten before resizing: the PDF copy is a JPEG anyway, and
+                # 3-channel RGB takes Pillow's fast resample path
+                img = _flatten_to_rgb(img)
+            if (target_w, target_h) == img.size:
+                # Already the right size: encode it as is, no resample or copy
+                resized_img = img
+            else:
+                # Near 1:1 BICUBIC's 4x4 kernel looks the same as LANCZOS' 6x6;
+                # keep LANCZOS where its extra lobes matter
+                scale = max(target_w / img.width, target_h / img.height)
+                resample = (
+                    Image.Resampling.BICUBIC if 0.67 <= scale <= 1.5
+                    else Image.Resampling.LANCZOS
+                )
+                # Box-reduce by whole factors until within 2x of the target, then
+                # finish with the real filter. thumbnail() does the same but keeps
+                # the aspect ratio, and the cm fields may deliberately stretch it
+                resized_img = img.resize((target_w, target_h), resample, reducing_gap=2.0)
+            if save_path is None:
+                buf = io.BytesIO()
+                resized_img.save(buf, format="JPEG", quality=85, subsampling=2,
+                                 optimize=False, progressive=False)
+                resized_img.close()
+                return (buf.getvalue(), w_cm, h_cm)
+            if is_jpeg:
+                resized_img.save(save_path, format="JPEG", quality=90, subsampling=2,
+                                 optimize=False, progressive=False)
+            else:
+                resized_img.save(save_path, quality=95)
+            # Drop the resized pixels now; the with-block only closes the
+            # decoded source, and a pool worker may be handed its next file
+            resized_img.close()
+
+    # Store path AND the CM dimensions you entered manually
+    return (save_path, w_cm, h_cm)
+
+def pack_a4_pages(sizes):
+    """First-Fit Decreasing Height shelf packing onto A4, layout only.
+
+    sizes is a list of (w_mm, h_mm), tallest first; returns one list of
+    (index, x, y) per page."""
+    PAGE_W, PAGE_H = 210, 297
+    MARGIN = 10
+    GAP = 2
+    RIGHT, BOTTOM = PAGE_W - MARGIN, PAGE_H - MARGIN
+
+    # Tallest first, so every image fits the height of any shelf already
+    # opened and only the width has to be checked. low_x is the smallest
+    # next_x on the page: if the image doesn't fit there it fits on none of
+    # its shelves, so full pages are passed over without walking them.
+    pages = []  # [shelves, placements, low_x], shelf = [next_x, y, height]
+    for i, (w_mm, h_mm) in enumerate(sizes):
+        placed = False
+        for page in pages:
+            shelves, placements, low_x = page
+            # First shelf on this page with room left in its row
+            if low_x + w_mm <= RIGHT:
+                for shelf in shelves:
+                    if shelf[0] + w_mm <= RIGHT:
+                        placements.append((i, shelf[0], shelf[1]))
+                        shelf[0] += w_mm + GAP
+                        page[2] = min(s[0] for s in shelves)
+                        placed = True
+                        break
+            # Otherwise open a new shelf below the last one, if it fits
+            if not placed:
+                y = shelves[-1][1] + shelves[-1][2] + GAP
+                if y + h_mm <= BOTTOM:
+                    shelves.append([MARGIN + w_mm + GAP, y, h_mm])
+                    placements.append((i, MARGIN, y))
+                    page[2] = min(low_x, shelves[-1][0])
+                    placed = True
+            if placed:
+                break
+
+        # No room anywhere: start a new page
+        if not placed:
+            pages.append([
+                [[MARGIN + w_mm + GAP, MARGIN, h_mm]],
+                [(i, MARGIN, MARGIN)],
+                MARGIN + w_mm + GAP
+            ])
+
+    return [placements for _, placements, _ in pages]
+
+def generate_a4_pdf(images_info, pdf_path):
+    """images_info is a list of (image, w_cm, h_cm), shelf-packed onto A4 pages.
+
+    image is a file path or encoded JPEG bytes, which fpdf2 embeds as-is
+    without decoding or recompressing. Only the layout needs every size up
+    front; pixels are never decoded, so memory is the compressed JPEGs."""
+    # CM to MM once, tallest first
+    items = sorted(
+        ((img_path, w_cm * 10, h_cm * 10) for img_path, w_cm, h_cm in images_info),
+        key=lambda item: item[2],
+        reverse=True
+    )
+    pages = pack_a4_pages([(w_mm, h_mm) for _, w_mm, h_mm in items])
+
+    pdf = FPDF("P", "mm", "A4")
+    pdf.set_auto_page_break(False)
+    for placements in pages:
+        pdf.add_page()
+        for i, x, y in placements:
+            img_path, w_mm, h_mm = items[i]
+            if isinstance(img_path, bytes):
+                img_path = io.BytesIO(img_path)
+            pdf.image(img_path, x=x, y=y, w=w_mm, h=h_mm)
+
+    pdf.output(pdf_path)
+
+# One core stays free for the UI thread and the voice listener
+POOL_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+def new_process_pool():
+    # Spawned, not forked: once libvips has started its threads in this
+    # process, a forked child can deadlock inside it
+    return ProcessPoolExecutor(max_workers=POOL_WORKERS,
+                               mp_context=multiprocessing.get_context("spawn"))
+
+class WorkerSignals(QObject):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(list, list)   # done file names, "name: error" failures
+
+class ResizeWorker(QRunnable):
+    """Runs a resize batch (and the PDF) on the thread pool, off the UI thread"""
+    def __init__(self, jobs, pdf_path=None, order=None, pool=None):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.jobs = jobs            # [(fname, _resize_one args), ...]
+        self.pdf_path = pdf_path    # None = save the resized files instead
+        self.order = order          # job indices in submission order
+        self.pool = pool            # caller's process pool, for saving files
+        self.pool_broken = False    # a pool process died; don't reuse it
+
+    def run(self):
+        done_names, failed = [], []
+        try:
+            done_names = self.run_batch(failed)
+        except Exception as e:
+            # Failures outside a single job (a dead pool at submit, a spawn
+            # or pickling error) must still reach the UI, or self.worker is
+            # never reset and START stays ignored
+            if isinstance(e, BrokenProcessPool):
+                self.pool_broken = True
+            logger.exception("Resize batch failed")
+            failed.append(f"Batch: {str(e) or type(e).__name__}".splitlines()[0])
+        finally:
+            # Names only: no image data waits in the queued signal for the UI
+            self.signals.finished.emit(done_names, failed)
+
+    def run_batch(self, failed):
+        """Resizes every job (and writes the PDF); returns the done names"""
+        total = len(self.jobs)
+        results = [None] * total
+        # Pillow and libvips release the GIL while decoding, resampling and
+        # encoding, so threads scale too. PDF mode uses them: the JPEG bytes
+        # stay in this process instead of being pickled back from workers.
+        # Saved files go to the caller's process pool, which outlives the
+        # batch so its spawned interpreters are only started once
+        if self.pdf_path:
+            pool = ThreadPoolExecutor(max_workers=POOL_WORKERS)
+        else:
+            pool = self.pool or new_process_pool()
+        try:
+            order = self.order if self.order is not None else range(total)
+            futures = {pool.submit(_resize_one, self.jobs[i][1]): i for i in order}
+            last_pct = -1
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    if isinstance(e, BrokenProcessPool):
+                        self.pool_broken = True
+                    logger.warning("Failed to process %s: %s", self.jobs[i][0], e)
+                    failed.append(f"{self.jobs[i][0]}: {e}".splitlines()[0])
+                pct = done * 100 // total
+                if pct != last_pct:
+                    last_pct = pct
+                    self.signals.progress.emit(pct)
+        finally:
+            if pool is not self.pool:
+                pool.shutdown()
+
+        done_names = [self.jobs[i][0] for i, r in enumerate(results) if r is not None]
+
+        if self.pdf_path and done_names:
+            # (JPEG bytes, width_cm, height_cm), in list order. Drop every
+            # other reference (the last loop future holds its result too),
+            # so the buffers are freed as soon as the PDF is out.
+            images_data_for_pdf = [r for r in results if r is not None]
+            results = futures = future = None
+            try:
+                generate_a4_pdf(images_data_for_pdf, self.pdf_path)
+            except Exception as e:
+                logger.exception("Failed to generate PDF")
+                failed.append(f"PDF: {e}")
+                done_names = []
+            images_data_for_pdf = None
+
+        return done_names
+
 # ----------------------------------------------------------------------
 # UI COMPONENT: UNIFIED PREVIEW & DROP ZONE
 # ----------------------------------------------------------------------
@@ -62,6 +451,39 @@ class VoiceSignals(QObject):
     remove_signal = pyqtSignal(str)
     select_image_signal = pyqtSignal(int)
 
+def read_preview_image(path, bounds, allow_rgb16):
+    """Decode straight to preview size instead of full resolution"""
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid() and not bounds.isEmpty() and (
+        size.width() > bounds.width() or size.height() > bounds.height()
+    ):
+        reader.setScaledSize(size.scaled(bounds, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    # Preview only: 16-bit colour halves the pixmap and its blits; keep
+    # full depth on high-DPI screens and for images with transparency
+    if allow_rgb16 and not image.hasAlphaChannel():
+        image = image.convertToFormat(QImage.Format.Format_RGB16)
+    return image
+
+class PreviewSignals(QObject):
+    loaded = pyqtSignal(str, QImage)
+
+class PreviewLoader(QRunnable):
+    """Decodes one preview on the thread pool; QPixmaps stay on the UI thread"""
+    def __init__(self, key, path, bounds, allow_rgb16):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.bounds = bounds
+        self.allow_rgb16 = allow_rgb16
+        self.signals = PreviewSignals()
+
+    def run(self):
+        image = read_preview_image(self.path, self.bounds, self.allow_rgb16)
+        self.signals.loaded.emit(self.key, image)
+
 class UnifiedCyberPreview(QLabel):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -71,48 +493,78 @@ class UnifiedCyberPreview(QLabel):
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setAcceptDrops(True)
         self.pixmap_data = None
+        self.wanted_key = None         # cache key of the image to show next
+        self.pending_keys = set()      # keys being decoded on the thread pool
+        self.shown_key = None          # (source, size, mode) currently on screen
+
+        # Fast scaling while resizing, one smooth pass once it settles
+        self.smooth_timer = QTimer(self)
+        self.smooth_timer.setSingleShot(True)
+        self.smooth_timer.setInterval(200)
+        self.smooth_timer.timeout.connect(self.update_preview)
         
-        self.setStyleSheet("""
-            QLabel {
-                color: white; 
-                font-size: 16px; 
-                background: rgba(10, 25, 41, 0.7); 
-                border-radius: 20px;
-                border: 2px solid #1e3a5f;
-            }
-        """)
+        self.setStyleSheet(PREVIEW_IDLE_STYLE)
 
     def set_image(self, path):
         if not path or not os.path.exists(path):
             return
-        self.pixmap_data = QPixmap(path)
+        # mtime in the key, so an image edited on disk is decoded again
+        key = f"{path}|{os.stat(path).st_mtime}"
+        self.wanted_key = key
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            self.set_pixmap(pixmap)
+        elif key not in self.pending_keys:
+            self.pending_keys.add(key)
+            loader = PreviewLoader(
+                key, path, self.size() - QSize(40, 40), self.devicePixelRatioF() <= 1
+            )
+            loader.signals.loaded.connect(self.on_image_loaded)
+            QThreadPool.globalInstance().start(loader)
+
+    def on_image_loaded(self, key, image):
+        self.pending_keys.discard(key)
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        # Ignore stale results: the user may have clicked on since
+        if key == self.wanted_key:
+            self.set_pixmap(pixmap)
+
+    def set_pixmap(self, pixmap):
+        self.pixmap_data = pixmap
         self.setText("") 
-        self.setStyleSheet("QLabel { background: #050a10; border-radius: 20px; border: 2px solid #00eaff; }")
+        self.setStyleSheet(PREVIEW_LOADED_STYLE)
         self.update_preview()
 
     def clear_preview(self):
+        self.wanted_key = None
+        self.shown_key = None
         self.pixmap_data = None
         self.setPixmap(QPixmap())
         self.setText("Drop images here\nor click anywhere to 'Add Images'")
-        self.setStyleSheet("""
-            QLabel {
-                color: white; 
-                font-size: 16px; 
-                background: rgba(10, 25, 41, 0.7); 
-                border-radius: 20px;
-                border: 2px solid #1e3a5f;
-            }
-        """)
+        self.setStyleSheet(PREVIEW_IDLE_STYLE)
 
-    def update_preview(self):
+    def update_preview(self, mode=Qt.TransformationMode.SmoothTransformation):
         if self.pixmap_data:
+            bounds = self.size() - QSize(40, 40)
+            # Expose/re-select with nothing changed: the label already has it
+            key = (self.pixmap_data.cacheKey(), bounds.width(), bounds.height(), mode)
+            if key == self.shown_key:
+                return
+            self.shown_key = key
             scaled = self.pixmap_data.scaled(
-                self.size() - QSize(40, 40), 
+                bounds, 
                 Qt.AspectRatioMode.KeepAspectRatio, 
-                Qt.TransformationMode.SmoothTransformation
+                mode
             )
             self.setPixmap(scaled)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.pixmap_data:
+            self.update_preview(Qt.TransformationMode.FastTransformation)
+            self.smooth_timer.start()
+
     def mousePressEvent(self, event):
         if hasattr(self.window(), 'load_images'):
             self.window().load_images()
@@ -120,9 +572,22 @@ class UnifiedCyberPreview(QLabel):
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
             event.accept()
-            self.setStyleSheet(self.styleSheet() + "border: 2px solid #00eaff;")
+            self.apply_style(PREVIEW_DRAG_STYLE if self.pixmap_data is None else PREVIEW_LOADED_STYLE)
+
+    def dragLeaveEvent(self, event):
+        self.restore_style()
+        super().dragLeaveEvent(event)
+
+    def restore_style(self):
+        self.apply_style(PREVIEW_IDLE_STYLE if self.pixmap_data is None else PREVIEW_LOADED_STYLE)
+
+    def apply_style(self, style):
+        # setStyleSheet re-polishes the widget even when the text is unchanged
+        if self.styleSheet() != style:
+            self.setStyleSheet(style)
 
     def dropEvent(self, event):
+        self.restore_style()
         urls = event.mimeData().urls()
         if urls:
             paths = [u.toLocalFile() for u in urls]
@@ -134,12 +599,22 @@ class UnifiedCyberPreview(QLabel):
 # ----------------------------------------------------------------------
 
 class NeonCyberGlowButton(QPushButton):
+    GLOW_MARGIN = 8      # space reserved around the button body for the glow
+    _glow_cache = {}     # (color, w, h, strength) -> pre-rendered glow QPixmap
+
     def __init__(self, text, color="#00eaff", parent=None, hover_glow=False):
         super().__init__(text, parent)
         self.hover_glow = hover_glow
         self.color = color
 
-        self.setMinimumHeight(44)
+        # 🔑 IMPORTANT
+        # Glow fades between two pre-rendered pixmaps: rest -> peak as _glow
+        # goes 0 -> 1. Hover buttons rest dark; the others rest at a soft glow.
+        self.rest_strength = 0.0 if hover_glow else 0.5
+        self.peak_strength = 0.6 if hover_glow else 1.0
+        self._glow = 0.0
+
+        self.setMinimumHeight(44 + 2 * self.GLOW_MARGIN)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
         self.setStyleSheet(f"""
@@ -150,71 +625,102 @@ class NeonCyberGlowButton(QPushButton):
                 border-radius: 12px;
                 font-weight: bold;
                 font-size: 15px;
+                margin: {self.GLOW_MARGIN}px;
             }}
         """)
 
-        # Glow effect
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setColor(QColor(color))
-        self.shadow.setOffset(0, 0)
-
-        # 🔑 IMPORTANT
-        self.shadow.setBlurRadius(0 if hover_glow else 20)
-        self.setGraphicsEffect(self.shadow)
-
         # Breathing animation (only used if NOT hover_glow)
-        self.inhale = QPropertyAnimation(self.shadow, b"blurRadius")
-        self.inhale.setDuration(2500)
-        self.inhale.setStartValue(20)
-        self.inhale.setEndValue(50)
-        self.inhale.setEasingCurve(QEasingCurve.Type.InOutSine)
-
-        self.exhale = QPropertyAnimation(self.shadow, b"blurRadius")
-        self.exhale.setDuration(2500)
-        self.exhale.setStartValue(50)
-        self.exhale.setEndValue(20)
-        self.exhale.setEasingCurve(QEasingCurve.Type.InOutSine)
-
-        self.sequence = QSequentialAnimationGroup()
-        self.sequence.addAnimation(self.inhale)
-        self.sequence.addAnimation(self.exhale)
-        self.sequence.setLoopCount(-1)
+        self.breathe_anim = QPropertyAnimation(self, b"glow", self)
+        self.breathe_anim.setDuration(5000)
+        self.breathe_anim.setStartValue(0.0)
+        self.breathe_anim.setKeyValueAt(0.5, 1.0)
+        self.breathe_anim.setEndValue(0.0)
+        self.breathe_anim.setEasingCurve(QEasingCurve.Type.InOutSine)
+        self.breathe_anim.setLoopCount(-1)
 
         # Hover animation (ONLY for hover_glow buttons)
-        self.hover_anim = QPropertyAnimation(self.shadow, b"blurRadius", self)
+        self.hover_anim = QPropertyAnimation(self, b"glow", self)
         self.hover_anim.setDuration(250)
         self.hover_anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
 
+    @classmethod
+    def glow_pixmap(cls, color, size, strength):
+        """Soft neon border rendered once per color/size instead of a live blur"""
+        key = (color, size.width(), size.height(), strength)
+        pixmap = cls._glow_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(size)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+
+            m = cls.GLOW_MARGIN
+            body = QRectF(0, 0, size.width(), size.height()).adjusted(m, m, -m, -m)
+            glow = QColor(color)
+            # Faint outer rings first, brighter towards the button edge
+            for d in range(m, 0, -1):
+                glow.setAlphaF(strength * (1 - d / (m + 1)) ** 2)
+                painter.setPen(QPen(glow, 2))
+                painter.drawRoundedRect(body.adjusted(-d, -d, d, d), 12 + d, 12 + d)
+            painter.end()
+            cls._glow_cache[key] = pixmap
+        return pixmap
+
+    @pyqtProperty(float)
+    def glow(self): return self._glow
+    @glow.setter
+    def glow(self, val): self._glow = val; self.update()
+
     def start_breathing(self):
-        if not self.hover_glow and self.sequence.state() != self.sequence.State.Running:
-            self.sequence.start()
+        if not self.hover_glow and self.breathe_anim.state() != QAbstractAnimation.State.Running:
+            self.breathe_anim.start()
 
     def stop_breathing(self):
-        self.sequence.stop()
+        self.breathe_anim.stop()
         if not self.hover_glow:
-            self.shadow.setBlurRadius(20)
+            self.glow = 0.0
+
+    def fade_glow(self, target):
+        self.hover_anim.stop()
+        self.hover_anim.setStartValue(self._glow)
+        self.hover_anim.setEndValue(target)
+        self.hover_anim.start()
 
     def enterEvent(self, event):
         if self.hover_glow:
-            self.hover_anim.stop()
-            self.hover_anim.setStartValue(self.shadow.blurRadius())
-            self.hover_anim.setEndValue(30)   # soft glow
-            self.hover_anim.start()
+            self.fade_glow(1.0)   # soft glow
         super().enterEvent(event)
 
     def leaveEvent(self, event):
         if self.hover_glow:
-            self.hover_anim.stop()
-            self.hover_anim.setStartValue(self.shadow.blurRadius())
-            self.hover_anim.setEndValue(0)
-            self.hover_anim.start()
+            self.fade_glow(0.0)
         super().leaveEvent(event)
+
+    def paintEvent(self, event):
+        # Two cached blits per frame instead of re-blurring the widget
+        painter = QPainter(self)
+        if self.rest_strength > 0 and self._glow < 1:
+            painter.setOpacity(1 - self._glow)
+            painter.drawPixmap(0, 0, self.glow_pixmap(self.color, self.size(), self.rest_strength))
+        if self._glow > 0:
+            painter.setOpacity(self._glow)
+            painter.drawPixmap(0, 0, self.glow_pixmap(self.color, self.size(), self.peak_strength))
+        painter.end()
+        super().paintEvent(event)
     
 class AnimatedGradientButton(QPushButton):
+    PINK = QColor("#ff007f")
+    CYAN = QColor("#00ffcc")
+    BODY = QColor(20, 20, 25)
+    TEXT = QColor("#ffffff")
+
     def __init__(self, text="", parent=None):
         super().__init__(text, parent)
         self._shift = 0.0
+        self._painted_shift = 0.0
         self._is_animating = False
+        self._grad_strip = None
         self.anim = QPropertyAnimation(self, b"shift", self)
         self.anim.setDuration(2000)
         self.anim.setStartValue(0); self.anim.setEndValue(100); self.anim.setLoopCount(-1)
@@ -223,35 +729,81 @@ class AnimatedGradientButton(QPushButton):
     @pyqtProperty(float)
     def shift(self): return self._shift
     @shift.setter
-    def shift(self, val): self._shift = val; self.update()
+    def shift(self, val):
+        self._shift = val
+        # Repaint every 2% of the loop: 50 frames per 2 s instead of ~120
+        if abs(val - self._painted_shift) >= 2:
+            self._painted_shift = val
+            self.update()
 
     def start_animation(self):
         self._is_animating = True
         self.anim.start()
+        self.sync_paused()
+
+    def sync_paused(self):
+        """Freeze the loop while the button is hidden or the window minimized"""
+        state = self.anim.state()
+        if state != QAbstractAnimation.State.Stopped:
+            hidden = not self.isVisible() or self.window().isMinimized()
+            if hidden != (state == QAbstractAnimation.State.Paused):
+                self.anim.setPaused(hidden)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.sync_paused()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.sync_paused()
 
     def stop_animation(self):
         self._is_animating = False
         self.anim.stop()
         self.update()      
 
+    def build_gradient_strip(self):
+        """One period of the pink/cyan border gradient, painted once per width"""
+        w, h = max(1, self.width()), max(1, self.height())
+        self._grad_strip = QPixmap(w, h)
+        grad = QLinearGradient(0, 0, w, 0)
+        grad.setColorAt(0.0, self.PINK)
+        grad.setColorAt(0.5, self.CYAN)
+        grad.setColorAt(1.0, self.PINK)
+        painter = QPainter(self._grad_strip)
+        painter.fillRect(self._grad_strip.rect(), QBrush(grad))
+        painter.end()
+
+    def resizeEvent(self, event):
+        self.build_gradient_strip()
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         rect = self.rect().adjusted(2, 2, -2, -2)
-        painter.setBrush(QColor(20, 20, 25))
+        painter.setBrush(self.BODY)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(rect, 10, 10)
         if self._is_animating:
-            s = (self._shift % 100) / 100
-            grad = QLinearGradient(rect.left(), rect.top(), rect.right(), rect.bottom())
-            grad.setColorAt((0.0 + s) % 1.0, QColor("#ff007f"))
-            grad.setColorAt((0.5 + s) % 1.0, QColor("#00ffcc"))
-            grad.setColorAt((1.0 + s) % 1.0, QColor("#ff007f"))
-            painter.setPen(QPen(QBrush(grad), 4))
+            if self._grad_strip is None:
+                self.build_gradient_strip()
+            # The strip tiles, so animating is just sliding the texture
+            sx = (self._shift % 100) / 100 * self._grad_strip.width()
+            brush = QBrush(self._grad_strip)
+            brush.setTransform(QTransform.fromTranslate(sx, 0))
+            painter.setPen(QPen(brush, 4))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawRoundedRect(rect, 10, 10)
-        painter.setPen(QColor("#ffffff"))
+        painter.setPen(self.TEXT)
         painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.text())
 
+class NumberedDelegate(QStyledItemDelegate):
+    """Prefixes "N. " at paint time, so rows never need renumbering"""
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.text = f"{index.row() + 1}. {option.text}"
+
 # ----------------------------------------------------------------------
 # MAIN APPLICATION
 # ----------------------------------------------------------------------
@@ -263,7 +815,21 @@ def add_text_glow(widget, color="#00eaff", blur=18):
     glow.setOffset(0, 0)
     widget.setGraphicsEffect(glow)
 
+@dataclass
+class FileEntry:
+    """One loaded image; loaded_files[i] belongs to row i of the file list"""
+    # No per-instance __dict__: six fixed slots per file
+    __slots__ = ("path", "width", "height", "ratio", "src_w", "src_h")
+    path: str
+    width: float     # cm
+    height: float    # cm
+    ratio: float
+    src_w: int       # source pixels, from the header
+    src_h: int
+
 class ImageResizerPro(QWidget):
+    _cm_validator = None
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("ImageResizer Pro v2.6 — Cyberpunk Metric Edition")
@@ -272,13 +838,43 @@ class ImageResizerPro(QWidget):
         self.voice_enabled = False
         self.voice_thread = None
         self.recognizer = sr.Recognizer()
+        self.mic = None                # opened and calibrated on first use
         
         self.last_voice_cmd = None
 
-        self.loaded_files = {} 
+        self.loaded_files = []         # FileEntry per list row, same order
+        self.loaded_paths = set()      # realpaths, to skip files added twice
+        # Size shared by every file while "apply all" is checked
+        self.global_w = 10.0
+        self.global_h = 15.0
         self.ratio = 1.0
+
+        # Decoded previews are cached by path so re-selecting an image is free
+        QPixmapCache.setCacheLimit(256 * 1024)  # KB
+
+        # Batch conversion runs on the thread pool (see ResizeWorker);
+        # saving files reuses one process pool, started on first use
+        self.worker = None
+        self.process_pool = None
+
+        # Coalesce keystrokes: only the last edit within 50 ms gets synced
+        self.sync_source = None
+        self.sync_entry = None
+        self.sync_timer = QTimer(self)
+        self.sync_timer.setSingleShot(True)
+        self.sync_timer.setInterval(50)
+        self.sync_timer.timeout.connect(self.do_sync)
+
         self.setup_ui()
 
+    @classmethod
+    def cm_validator(cls):
+        """One validator shared by every cm field"""
+        if cls._cm_validator is None:
+            cls._cm_validator = QDoubleValidator(0.1, 1000.0, 2, QApplication.instance())
+            cls._cm_validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+        return cls._cm_validator
+
     def setup_ui(self):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -332,28 +928,20 @@ class ImageResizerPro(QWidget):
         grid.setHorizontalSpacing(10)
         grid.setVerticalSpacing(6)
         
-        input_style = """
-            background: #1e293b;
-            color: white;
-            border: 1px solid #334155;
-            padding: 8px;
-            border-radius: 6px;
-        """
-        cm_validator = QDoubleValidator(0.1, 1000.0, 2, self)
-        cm_validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+        cm_validator = self.cm_validator()
         
         # Width
         lbl_w = QLabel("Width (cm):")
         self.w_input = QLineEdit("10.0")
         self.w_input.setValidator(cm_validator)
-        self.w_input.setStyleSheet(input_style)
+        self.w_input.setStyleSheet(INPUT_STYLE)
         self.w_input.setFixedWidth(318)
         
         # Height
         lbl_h = QLabel("Height (cm):")
         self.h_input = QLineEdit("15.0")
         self.h_input.setValidator(cm_validator)
-        self.h_input.setStyleSheet(input_style)
+        self.h_input.setStyleSheet(INPUT_STYLE)
         self.h_input.setFixedWidth(318)
 
         # Enter key navigation
@@ -363,37 +951,7 @@ class ImageResizerPro(QWidget):
         # Checkbox (top-right)
         self.cb_apply_all = QCheckBox("")
         self.cb_apply_all.setToolTip("Apply same size to all images")
-        self.cb_apply_all.setStyleSheet("""
-            QCheckBox {
-                background: transparent;
-            }
-            
-            /* checkbox square */
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 4px;
-                border: 2px solid #00eaff;
-                background-color: transparent;
-            }
-            
-            /* hover state */
-            QCheckBox::indicator:hover {
-                background-color: rgba(0, 234, 255, 40);
-                border: 1px solid #00ffff;
-            }
-            
-            /* checked state */
-            QCheckBox::indicator:checked {
-                background-color: #00eaff;
-                border: 1px solid #00ffff;
-            }
-            
-            /* pressed state */
-            QCheckBox::indicator:pressed {
-                background-color: rgba(0, 255, 255, 120);
-            }
-        """)
+        self.cb_apply_all.setStyleSheet(CHECKBOX_STYLE)
         
         grid.addWidget(lbl_w, 0, 0)
         grid.addWidget(self.w_input, 1, 0)
@@ -417,7 +975,7 @@ class ImageResizerPro(QWidget):
         self.cb_ratio.setChecked(True)
         
         lbl_ratio = QLabel("Maintain Aspect Ratio")
-        lbl_ratio.setStyleSheet("color: #cfefff; font-size: 14px; background: transparent;")
+        lbl_ratio.setStyleSheet(OPTION_LABEL_STYLE)
         add_text_glow(lbl_ratio) # Only the text glows!
         
         ratio_layout.addWidget(self.cb_ratio)
@@ -431,7 +989,7 @@ class ImageResizerPro(QWidget):
         self.cb_pdf.setChecked(True)
         
         lbl_pdf = QLabel("Auto Arrange A4 PDF")
-        lbl_pdf.setStyleSheet("color: #cfefff; font-size: 14px; background: transparent;")
+        lbl_pdf.setStyleSheet(OPTION_LABEL_STYLE)
         add_text_glow(lbl_pdf) # Only the text glows!
         
         pdf_layout.addWidget(self.cb_pdf)
@@ -441,37 +999,7 @@ class ImageResizerPro(QWidget):
         
         # --- Apply style to the checkboxes ---
         for cb in [self.cb_ratio, self.cb_pdf]:
-            cb.setStyleSheet("""
-            QCheckBox {
-                background: transparent;
-            }
-            
-            /* checkbox square */
-            QCheckBox::indicator {
-                width: 14px;
-                height: 14px;
-                border-radius: 4px;
-                border: 1px solid #00eaff;
-                background-color: transparent;
-            }
-            
-            /* hover state */
-            QCheckBox::indicator:hover {
-                background-color: rgba(0, 234, 255, 40);
-                border: 1px solid #00ffff;
-            }
-            
-            /* checked state */
-            QCheckBox::indicator:checked {
-                background-color: #00eaff;
-                border: 1px solid #00ffff;
-            }
-            
-            /* pressed state */
-            QCheckBox::indicator:pressed {
-                background-color: rgba(0, 255, 255, 120);
-            }
-            """)
+            cb.setStyleSheet(OPTION_CHECKBOX_STYLE)
         
         # MULTI-IMAGE LIST
         list_container = QFrame()
@@ -484,6 +1012,7 @@ class ImageResizerPro(QWidget):
             QListWidget::item { padding: 3px; border-bottom: 1px solid #111b2d; border-radius: 4px; }
             QListWidget::item:selected { color: #00eaff; background: rgba(0, 234, 255, 0.1); border: 1px solid #00eaff; }
         """)
+        self.file_list.setItemDelegate(NumberedDelegate(self.file_list))
         self.file_list.itemClicked.connect(self.on_item_clicked)
         list_layout.addWidget(self.file_list)
         right_layout.addWidget(list_container, 1)
@@ -525,7 +1054,7 @@ class ImageResizerPro(QWidget):
         layout.addWidget(self.right_panel)
 
         self.setStyleSheet(self.get_main_style())
-        self.cb_apply_all.toggled.connect(self.save_current_dimensions)
+        self.cb_apply_all.toggled.connect(self.on_apply_all_toggled)
         
         self.w_input.textChanged.connect(self.sync_height)
         self.h_input.textChanged.connect(self.sync_width)
@@ -538,69 +1067,90 @@ class ImageResizerPro(QWidget):
         """
 
     def load_images(self):
-        files, _ = QFileDialog.getOpenFileNames(self, "Select Images", "", "Images (*.png *.jpg *.jpeg *.webp)")
+        files, _ = QFileDialog.getOpenFileNames(self, "Select Images", "", IMAGE_FILTER)
         if files:
             self.handle_multiple_files(files)
 
     def load_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder")
         if folder:
-            valid_exts = ('.png', '.jpg', '.jpeg', '.webp')
-            files = [os.path.join(folder, f) for f in os.listdir(folder) if f.lower().endswith(valid_exts)]
+            with os.scandir(folder) as entries:
+                files = [
+                    e.path for e in entries
+                    if e.is_file() and os.path.splitext(e.name)[1].lower() in IMAGE_EXTS
+                ]
             if files:
                 self.handle_multiple_files(files)
 
     def handle_multiple_files(self, paths):
+        # One repaint for the whole batch instead of one per inserted item
+        self.file_list.setUpdatesEnabled(False)
+        self.file_list.blockSignals(True)
+        names = []
         for path in paths:
-            fname = os.path.basename(path)
-            if fname not in self.loaded_files:
-                self.loaded_files[fname] = {
-                    "path": path,
-                    "width": self.w_input.text() if self.cb_apply_all.isChecked() else "10.0",
-                    "height": self.h_input.text() if self.cb_apply_all.isChecked() else "15.0"
-                }
-                # Create item without the number first; we will update all labels next
-                item = QListWidgetItem()
-                item.setText(fname)                      # display text
-                item.setData(Qt.ItemDataRole.UserRole, fname)  # ✅ real key
-                self.file_list.addItem(item)
-        
-        self.reindex_list() # Helper to add the numbers
+            real_path = os.path.realpath(path)
+            if real_path not in self.loaded_paths:
+                self.loaded_paths.add(real_path)
+                size = QImageReader(path).size()  # header only, no decode
+                w, h = size.width(), size.height()
+                self.loaded_files.append(FileEntry(
+                    path=path,
+                    width=10.0,     # while "apply all" is on, the shared size is used
+                    height=15.0,
+                    ratio=w / h if w > 0 and h > 0 else 1.0,
+                    src_w=max(w, 0),
+                    src_h=max(h, 0)
+                ))
+                names.append(os.path.basename(path))     # display text (numbered by the delegate)
+        # One model insert for the batch rather than a rowsInserted per file
+        self.file_list.addItems(names)
+        self.file_list.blockSignals(False)
+        self.file_list.setUpdatesEnabled(True)
+        self.file_list.viewport().update()
         
         if paths:
             self.file_list.setCurrentRow(self.file_list.count() - 1)
             self.on_item_clicked(self.file_list.currentItem())
             self.update_run_button_state()
 
+    def entry_for(self, item):
+        """FileEntry behind a list item (rows and loaded_files stay aligned)"""
+        row = self.file_list.row(item) if item else -1
+        return self.loaded_files[row] if 0 <= row < len(self.loaded_files) else None
+
+    def dimensions_of(self, entry):
+        if self.cb_apply_all.isChecked():
+            return self.global_w, self.global_h
+        return entry.width, entry.height
+
+    def remove_row(self, row):
+        entry = self.loaded_files.pop(row)
+        self.loaded_paths.discard(os.path.realpath(entry.path))
+        self.file_list.takeItem(row)
+
     def on_item_clicked(self, item):
-        fname = item.data(Qt.ItemDataRole.UserRole)
-        data = self.loaded_files.get(fname)
+        self.flush_sync()
+        data = self.entry_for(item)
         if data:
             try:
-                with Image.open(data["path"]) as img:
-                    self.ratio = img.width / img.height
+                self.ratio = data.ratio
                 
                 self.w_input.blockSignals(True)
                 self.h_input.blockSignals(True)
-                self.w_input.setText(data["width"])
-                self.h_input.setText(data["height"])
+                width, height = self.dimensions_of(data)
+                self.w_input.setText(str(width))
+                self.h_input.setText(str(height))
                 self.w_input.blockSignals(False)
                 self.h_input.blockSignals(False)
                 
-                self.preview_area.set_image(data["path"])
+                self.preview_area.set_image(data.path)
             except Exception as e:
-                print(f"Error loading {fname}: {e}")
+                print(f"Error loading {data.path}: {e}")
 
     def remove_selected(self):
         current_item = self.file_list.currentItem()
         if current_item:
-            display_text = current_item.text()
-            fname = display_text.split(". ", 1)[-1] # Removes the "1. " prefix
-            
-            self.loaded_files.pop(fname, None)
-            self.file_list.takeItem(self.file_list.row(current_item))
-            
-            self.reindex_list() # Refresh numbers for remaining items
+            self.remove_row(self.file_list.row(current_item))
             
             if self.file_list.count() == 0:
                self.preview_area.clear_preview()
@@ -620,6 +1170,16 @@ class ImageResizerPro(QWidget):
             self.btn_run.start_animation()
         else:
             self.btn_run.stop_animation()
+
+    def closeEvent(self, event):
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.btn_run.sync_paused()
     
     def stop_voice_mode(self):
         if not self.voice_enabled:
@@ -668,7 +1228,8 @@ class ImageResizerPro(QWidget):
             )
             self.btn_voice.start_breathing()  # ✅ start glow only when ON
     
-            self.voice_thread = threading.Thread(target=self.voice_loop, daemon=True)
+            previous = self.voice_thread
+            self.voice_thread = threading.Thread(target=self.voice_loop, args=(previous,), daemon=True)
             self.voice_thread.start()
         else:
             self.btn_voice.setText("VOICE MODE OFF")
@@ -677,34 +1238,48 @@ class ImageResizerPro(QWidget):
             )
             self.btn_voice.stop_breathing()   # ✅ stop glow when OFF
     
-    def voice_loop(self):
+    def voice_loop(self, previous=None):
         print("🎤 Google Voice Listening")
     
-        mic = sr.Microphone()
+        # A quick off/on toggle: let the old loop release the shared mic first
+        if previous is not None:
+            previous.join()
+    
+        if self.mic is None:
+            # Calibrate once; later toggles reuse the mic and its threshold
+            self.mic = sr.Microphone()
+            with self.mic as source:
+                self.recognizer.adjust_for_ambient_noise(source, duration=0.6)
+            self.recognizer.dynamic_energy_threshold = False
+        mic = self.mic
+    
+        # Capture keeps running in the background while a phrase is sent to
+        # Google, so the next command is recorded during the upload.
+        phrases = queue.Queue()
+        stop_listening = self.recognizer.listen_in_background(
+            mic,
+            lambda _, audio: phrases.put(audio),
+            phrase_time_limit=4
+        )
     
-        with mic as source:
-            self.recognizer.adjust_for_ambient_noise(source, duration=0.6)
+        while self.voice_enabled and self.voice_thread is threading.current_thread():
+            try:
+                audio = phrases.get(timeout=0.5)
     
-            while self.voice_enabled:
-                try:
-                    audio = self.recognizer.listen(
-                        source,
-                        timeout=5,
-                        phrase_time_limit=4
-                    )
+                text = self.recognizer.recognize_google(audio)
+                text = text.lower().strip()
     
-                    text = self.recognizer.recognize_google(audio)
-                    text = text.lower().strip()
+                print("🗣", text)
+                self.parse_voice_command(text)
     
-                    print("🗣", text)
-                    self.parse_voice_command(text)
+            except queue.Empty:
+                continue
+            except sr.UnknownValueError:
+                continue
+            except Exception as e:
+                print("Voice error:", e)
     
-                except sr.WaitTimeoutError:
-                    continue
-                except sr.UnknownValueError:
-                    continue
-                except Exception as e:
-                    print("Voice error:", e)
+        stop_listening(wait_for_stop=True)
 
     def stop_voice_mode(self):
         if not self.voice_enabled:
@@ -732,6 +1307,7 @@ class ImageResizerPro(QWidget):
         """
         if param == "all":
             self.loaded_files.clear()
+            self.loaded_paths.clear()
             self.file_list.clear()
             self.preview_area.clear_preview()
         
@@ -747,11 +1323,7 @@ class ImageResizerPro(QWidget):
         try:
             index = int(param) - 1
             if 0 <= index < self.file_list.count():
-                item = self.file_list.item(index)
-                fname = item.data(Qt.ItemDataRole.UserRole)
-                self.loaded_files.pop(fname, None)
-                self.file_list.takeItem(index)
-                self.reindex_list()
+                self.remove_row(index)
     
                 # Update selection
                 if self.file_list.count() > 0:
@@ -764,10 +1336,7 @@ class ImageResizerPro(QWidget):
             # If parsing fails, just remove current
             current_item = self.file_list.currentItem()
             if current_item:
-                fname = current_item.data(Qt.ItemDataRole.UserRole)
-                self.loaded_files.pop(fname, None)
-                self.file_list.takeItem(self.file_list.row(current_item))
-                self.reindex_list()
+                self.remove_row(self.file_list.row(current_item))
                 if self.file_list.count() > 0:
                     self.file_list.setCurrentRow(0)
                     self.on_item_clicked(self.file_list.currentItem())
@@ -792,7 +1361,7 @@ class ImageResizerPro(QWidget):
             if checkbox.isChecked():
                 checkbox.setChecked(False)
                 return True
-        elif "on" in text or any(k in text for k in apply_all_keywords):
+        elif "on" in text or _CATEGORY_RE["apply_all"].search(text):
             if not checkbox.isChecked():
                 checkbox.setChecked(True)
                 return True
@@ -804,13 +1373,15 @@ class ImageResizerPro(QWidget):
         print("🧠 Parsing:", text)
     
         # ---------- EXTRACT NUMERIC VALUE FOR WIDTH/HEIGHT ----------
-        nums = re.findall(r"\d+\.?\d*", text)
+        nums = _NUM_RE.findall(text)
         value = float(nums[0]) if nums else None
         if value is None:
             value = words_to_number(text)  # Only for width/height commands
     
+        command = match_command(text)
+    
         # ---------- WIDTH ----------
-        if any(k in text for k in width_keywords):
+        if command == "width":
             if value is not None:
                 self.vs.command_received.emit("width", value)
                 self.last_voice_cmd = None
@@ -818,7 +1389,7 @@ class ImageResizerPro(QWidget):
                 self.last_voice_cmd = "width"
     
         # ---------- HEIGHT ----------
-        elif any(k in text for k in height_keywords):
+        elif command == "height":
             if value is not None:
                 self.vs.command_received.emit("height", value)
                 self.last_voice_cmd = None
@@ -826,26 +1397,26 @@ class ImageResizerPro(QWidget):
                 self.last_voice_cmd = "height"
     
         # ---------- START PROCESS ----------
-        elif any(k in text for k in start_keywords):
+        elif command == "start":
             self.vs.trigger_process.emit()
             self.last_voice_cmd = None
     
         # ---------- CHECKBOX COMMANDS ----------
-        elif any(k in text for k in apply_all_keywords):
+        elif command == "apply_all":
             changed = self.set_checkbox_state(self.cb_apply_all, text)
             if changed:
                 self.save_current_dimensions()
     
-        elif any(k in text for k in ratio_keywords):
+        elif command == "ratio":
             changed = self.set_checkbox_state(self.cb_ratio, text)
             if changed and self.file_list.currentItem():
                 self.sync_height()
     
-        elif any(k in text for k in pdf_keywords):
+        elif command == "pdf":
             self.set_checkbox_state(self.cb_pdf, text)
     
         # ---------- REMOVE IMAGE(S) ----------
-        elif any(k in text for k in remove_keywords):
+        elif command == "remove":
             if "all" in text:
                 self.vs.remove_signal.emit("all")
             elif value is not None:
@@ -855,30 +1426,22 @@ class ImageResizerPro(QWidget):
             self.last_voice_cmd = None
     
         # ---------- ADD FOLDER ----------
-        elif any(k in text for k in add_folder_keywords):
+        elif command == "add_folder":
             self.vs.add_folder_signal.emit()
     
         # ---------- ADD IMAGE ----------
-        elif any(k in text for k in add_image_keywords):
+        elif command == "add_image":
             self.vs.add_image_signal.emit()
     
         # ---------- SELECT IMAGE BY NUMBER (DIGITS ONLY) ----------
         else:
-            selected = False
-            for kw in select_img_keywords:
-                # Match keyword optionally followed by a dot, then space(s), then digits
-                pattern = rf"{kw}\.?\s+(\d+)"
-                match = re.search(pattern, text)
-                if match:
-                    num = int(match.group(1))
-                    self.vs.select_image_signal.emit(num)
-                    selected = True
-                    break
-            if selected:
+            match = _SELECT_IMG_RE.search(text)
+            if match:
+                self.vs.select_image_signal.emit(int(match.group(1)))
                 return
     
         # ---------- END / STOP ASSISTANT ----------
-        if any(k in text for k in end_keywords):  
+        if _CATEGORY_RE["end"].search(text):
             self.vs.stop_voice_signal.emit()
             return
     
@@ -898,31 +1461,43 @@ class ImageResizerPro(QWidget):
             self.h_input.setText(str(value))
             self.sync_width()
 
-    def reindex_list(self):
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            raw_name = item.data(Qt.ItemDataRole.UserRole)
-            item.setText(f"{i + 1}. {raw_name}")
-           
     def sync_height(self):
-        if self.cb_ratio.isChecked() and self.file_list.currentItem():
-            try:
-                w = float(self.w_input.text() or 0)
-                self.h_input.blockSignals(True)
-                self.h_input.setText(f"{w / self.ratio:.1f}")
-                self.h_input.blockSignals(False)
-            except: pass
-        self.save_current_dimensions()
+        self.queue_sync("width")
 
     def sync_width(self):
-        if self.cb_ratio.isChecked() and self.file_list.currentItem():
+        self.queue_sync("height")
+
+    def queue_sync(self, source):
+        item = self.file_list.currentItem()
+        self.sync_source = source
+        self.sync_entry = self.entry_for(item)
+        # invokeMethod so voice commands can queue a sync from their own thread
+        QMetaObject.invokeMethod(self.sync_timer, "start")
+
+    def set_text_quietly(self, field, text):
+        # Skip the setText (and its relayout) when nothing would change
+        if field.text() != text:
+            field.blockSignals(True)
+            field.setText(text)
+            field.blockSignals(False)
+
+    def flush_sync(self):
+        """Apply a pending edit now, before the selection or the files change"""
+        if self.sync_timer.isActive():
+            self.sync_timer.stop()
+            self.do_sync()
+
+    def do_sync(self, apply_all=None):
+        if self.cb_ratio.isChecked() and self.sync_entry:
             try:
-                h = float(self.h_input.text() or 0)
-                self.w_input.blockSignals(True)
-                self.w_input.setText(f"{h * self.ratio:.1f}")
-                self.w_input.blockSignals(False)
-            except: pass
-        self.save_current_dimensions()
+                if self.sync_source == "width":
+                    w = float(self.w_input.text())
+                    self.set_text_quietly(self.h_input, format_cm(w / self.ratio))
+                else:
+                    h = float(self.h_input.text())
+                    self.set_text_quietly(self.w_input, format_cm(h * self.ratio))
+            except (ValueError, ZeroDivisionError): pass
+        self.save_dimensions(self.sync_entry, apply_all)
     
     def focus_height(self):
         self.h_input.setFocus()
@@ -932,62 +1507,43 @@ class ImageResizerPro(QWidget):
         self.w_input.setFocus()
         self.w_input.selectAll()
 
+    def on_apply_all_toggled(self, checked):
+        if not checked:
+            # An edit still in the debounce was typed under "apply all":
+            # settle it into the shared size before handing that out
+            if self.sync_timer.isActive():
+                self.sync_timer.stop()
+                self.do_sync(apply_all=True)
+            # Files keep the shared size they were using, as before
+            for data in self.loaded_files:
+                data.width, data.height = self.global_w, self.global_h
+        self.save_current_dimensions()
+
     def save_current_dimensions(self):
-        w_val = self.w_input.text()
-        h_val = self.h_input.text()
-    
-        if self.cb_apply_all.isChecked():
-            for fname in self.loaded_files:
-                self.loaded_files[fname]["width"] = w_val
-                self.loaded_files[fname]["height"] = h_val
-        else:
-            item = self.file_list.currentItem()
-            if item:
-                fname = item.data(Qt.ItemDataRole.UserRole)
-                if fname in self.loaded_files:
-                    self.loaded_files[fname]["width"] = w_val
-                    self.loaded_files[fname]["height"] = h_val
-  
-    def generate_a4_pdf(self, images_info, pdf_path):
-        """images_info is now a list of (path, w_cm, h_cm)"""
-        pdf = FPDF("P", "mm", "A4")
-        pdf.set_auto_page_break(False)
-        pdf.add_page()
-    
-        PAGE_W, PAGE_H = 210, 297
-        MARGIN = 10
-        GAP = 2
-    
-        x = MARGIN
-        y = MARGIN
-        row_max_height = 0
-    
-        for img_path, w_cm, h_cm in images_info:
-            # Convert CM to MM for FPDF
-            w_mm = w_cm * 10
-            h_mm = h_cm * 10
-    
-            # Check if we need a new row
-            if x + w_mm > PAGE_W - MARGIN:
-                x = MARGIN
-                y += row_max_height + GAP
-                row_max_height = 0
-    
-            # Check if we need a new page
-            if y + h_mm > PAGE_H - MARGIN:
-                pdf.add_page()
-                x = MARGIN
-                y = MARGIN
-                row_max_height = 0
-    
-            pdf.image(img_path, x=x, y=y, w=w_mm, h=h_mm)
-    
-            x += w_mm + GAP
-            row_max_height = max(row_max_height, h_mm)
-    
-        pdf.output(pdf_path)
+        self.save_dimensions(self.entry_for(self.file_list.currentItem()))
 
+    def save_dimensions(self, entry, apply_all=None):
+        # Parsed once here; everything downstream works with floats
+        if apply_all is None:
+            apply_all = self.cb_apply_all.isChecked()
+        try:
+            w_val = float(self.w_input.text())
+            h_val = float(self.h_input.text())
+        except ValueError:
+            return  # half-typed ("", "."): keep the last good size
+    
+        if apply_all:
+            # O(1): one shared size instead of rewriting every file
+            self.global_w, self.global_h = w_val, h_val
+        elif entry is not None:
+            entry.width = w_val
+            entry.height = h_val
+  
     def process(self):
+        if self.worker is not None:
+            return  # a batch is already running
+
+        self.flush_sync()
         if not self.loaded_files:
             QMessageBox.warning(self, "Error", "No images loaded!")
             return
@@ -1000,59 +1556,77 @@ class ImageResizerPro(QWidget):
             return
     
         self.progress.setValue(0)
-        total = len(self.loaded_files)
-        # We now store a tuple of (path, width_cm, height_cm)
-        images_data_for_pdf = []
-        
+        self.output_dir = output_dir
         only_pdf = self.cb_pdf.isChecked()
     
-        for i, (fname, data) in enumerate(self.loaded_files.items()):
-            try:
-                with Image.open(data["path"]) as img:
-                    dpi = 300
-                    cm_to_inch = 2.54
-    
-                    target_w = int((float(data["width"]) / cm_to_inch) * dpi)
-                    target_h = int((float(data["height"]) / cm_to_inch) * dpi)
-    
-                    resized_img = img.resize(
-                        (target_w, target_h),
-                        Image.Resampling.LANCZOS
-                    )
-    
-                    save_path = output_dir / f"temp_resized_{fname}" if only_pdf else output_dir / f"resized_{fname}"
-                    resized_img.save(save_path, quality=95)
-                    
-                    # Store path AND the CM dimensions you entered manually
-                    images_data_for_pdf.append((str(save_path), float(data["width"]), float(data["height"])))
-    
-                self.progress.setValue(int(((i + 1) / total) * 100))
-                QApplication.processEvents()
-    
-            except Exception as e:
-                print(f"Failed to process {fname}: {e}")
-    
-        if only_pdf and images_data_for_pdf:
+        out_dir_str = str(output_dir)
+        jobs = []
+        used_names = set()
+        for data in self.loaded_files:
+            fname = os.path.basename(data.path)
+            # Same name from different folders: keep both outputs
+            stem, ext = os.path.splitext(fname)
+            n = 1
+            while fname.lower() in used_names:
+                n += 1
+                fname = f"{stem}_{n}{ext}"
+            used_names.add(fname.lower())
+
+            # PDF mode keeps the resized images in memory, no temp files
+            save_path = None if only_pdf else os.path.join(out_dir_str, "resized_" + fname)
+            width, height = self.dimensions_of(data)
+            jobs.append((fname, (data.path, width, height, save_path)))
+
+        if only_pdf:
             timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            pdf_path = output_dir / f"ImageResizer_{timestamp}.pdf"
-        
-            self.generate_a4_pdf(images_data_for_pdf, str(pdf_path))
-            
-            for img_info in images_data_for_pdf:
-                try:
-                    p = Path(img_info[0])
-                    if p.exists(): p.unlink()
-                except: pass
-            
-            msg = f"PDF Generated successfully!\nLocation: {pdf_path}"
+            self.pdf_path = output_dir / f"ImageResizer_{timestamp}.pdf"
         else:
-            msg = f"All images resized and saved to:\n{output_dir}"
-    
-        QMessageBox.information(self, "Success", msg)
+            self.pdf_path = None
+
+        # Largest sources first, so the slowest jobs don't start last and
+        # leave one worker busy at the end; equal sizes run back to back
+        sizes = [(e.src_w * e.src_h, e.src_w, e.src_h) for e in self.loaded_files]
+        order = sorted(range(len(jobs)), key=sizes.__getitem__, reverse=True)
+
+        if only_pdf:
+            pool = None
+        else:
+            if self.process_pool is None:
+                self.process_pool = new_process_pool()
+            pool = self.process_pool
+        self.worker = ResizeWorker(jobs, str(self.pdf_path) if only_pdf else None, order, pool)
+        self.worker.signals.progress.connect(self.progress.setValue)
+        self.worker.signals.finished.connect(self.on_process_finished)
+        QThreadPool.globalInstance().start(self.worker)
+
+    def on_process_finished(self, done_names, failed):
+        if self.worker.pool_broken:
+            # A worker process died; the next batch starts a fresh pool
+            self.process_pool.shutdown(wait=False)
+            self.process_pool = None
+        self.worker = None
+
+        if self.pdf_path and done_names:
+            msg = f"PDF Generated successfully!\nLocation: {self.pdf_path}"
+        elif self.pdf_path:
+            msg = "No PDF was generated."
+        elif done_names:
+            msg = f"All images resized and saved to:\n{self.output_dir}"
+        else:
+            msg = "No images were resized."
+        # All failures in one dialog, not one console line per file
+        if failed:
+            msg += f"\n\nFailed ({len(failed)}):\n" + "\n".join(failed[:10])
+            if len(failed) > 10:
+                msg += f"\n… and {len(failed) - 10} more"
+    
+        QMessageBox.information(self, "Success" if done_names else "Error", msg)
         QTimer.singleShot(8000, self.reset_after_process)
 
     def reset_after_process(self):
+        self.sync_timer.stop()
         self.loaded_files.clear()
+        self.loaded_paths.clear()
         self.file_list.clear()
         self.preview_area.clear_preview()
     
@@ -1078,6 +1652,13 @@ class ImageResizerPro(QWidget):
         print("🔄 UI reset after 8 seconds (voice untouched)")
 
 if __name__ == "__main__":
+    # Spawned resize workers re-run this file; in a frozen .exe this makes
+    # them run their task instead of opening another window
+    multiprocessing.freeze_support()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    # Pillow-SIMD versions carry a .postN suffix (e.g. 9.5.0.post1)
+    if pyvips is None and ".post" not in PIL_VERSION:
+        print(f"ℹ Stock Pillow {PIL_VERSION}: install pillow-simd for faster resizing")
     app = QApplication(sys.argv)
     window = ImageResizerPro()
     window.show()